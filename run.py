@@ -5,73 +5,119 @@ Professional job market data collection and analysis
 """
 
 import logging
+import logging.handlers
+import multiprocessing
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.util import Finalize
+from pathlib import Path
+from src.models import JOB_FIELDS
 from src.scraper import GoogleJobsScraper
-from src.utils import DataProcessor, ReportGenerator
+from src.utils import DataProcessor, JobCsvWriter, MarketAggregator, ReportGenerator
+
+# Scraper owned by the current worker process, created on its first task
+_scraper = None
+
+def _init_worker(log_queue):
+    """Route worker log records through the parent's queue listener"""
+    root = logging.getLogger()
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(logging.INFO)
+
+def _shutdown_worker():
+    """Close the worker's WebDriver when the process exits"""
+    if _scraper is not None:
+        _scraper.close()
+
+def _worker(city_config):
+    """Scrape one city, reusing this process's WebDriver across tasks"""
+    global _scraper
+    
+    if _scraper is None:
+        scraper = GoogleJobsScraper(headless=True)
+        if not scraper.init_driver():
+            raise RuntimeError("Failed to initialize WebDriver")
+        _scraper = scraper
+        Finalize(None, _shutdown_worker, exitpriority=10)
+    
+    return _scraper.scrape_city(
+        city=city_config['name'],
+        country_code=city_config['country_code'],
+        language=city_config['language']
+    )
 
 def main():
     """Main execution function"""
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s'
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('scraper.log'),
+            logging.StreamHandler()
+        ]
     )
     
     logger = logging.getLogger(__name__)
     logger.info("Starting Google Jobs Scraper")
     
-    # Initialize scraper
-    scraper = GoogleJobsScraper(headless=True)
-    
-    if not scraper.init_driver():
-        logger.error("Failed to initialize scraper. Exiting.")
-        return
-    
-    all_jobs_data = []
+    # Workers log through a queue so only this process touches scraper.log
+    log_queue = multiprocessing.Queue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *logging.getLogger().handlers, respect_handler_level=True
+    )
+    listener.start()
     
     try:
         # Load city configuration
         cities = DataProcessor.load_city_config()
         logger.info(f"Loaded configuration for {len(cities)} cities")
         
-        # Scrape jobs for each city
-        for i, city_config in enumerate(cities, 1):
-            city_name = city_config['name']
-            logger.info(f"Processing city {i}/{len(cities)}: {city_name}")
-            
-            city_jobs = scraper.scrape_city(
-                city=city_name,
-                country_code=city_config['country_code'],
-                language=city_config['language']
-            )
-            
-            all_jobs_data.extend(city_jobs)
-            logger.info(f"Completed {city_name}: {len(city_jobs)} jobs collected")
+        # Scrape cities in parallel, one WebDriver per worker process
+        max_workers = max(1, min(len(cities), os.cpu_count() or 1))
+        logger.info(f"Starting {max_workers} scraper workers")
+        
+        # Rows go to disk as each city finishes; only running totals stay in memory
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        aggregator = MarketAggregator()
+        
+        with JobCsvWriter(f"jobs_data_{timestamp}.csv", JOB_FIELDS) as csv_writer, \
+             ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_worker,
+                                 initargs=(log_queue,)) as executor:
+            futures = {executor.submit(_worker, city_config): city_config['name']
+                       for city_config in cities}
             
-            # Rate limiting between cities
-            if i < len(cities):
-                logger.info("Waiting before next city...")
-                time.sleep(5)
+            for i, future in enumerate(as_completed(futures), 1):
+                city_name = futures[future]
+                
+                try:
+                    city_jobs = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to scrape {city_name}: {e}")
+                    continue
+                
+                csv_writer.write_rows(city_jobs)
+                aggregator.update(city_jobs)
+                logger.info(f"Completed {city_name} ({i}/{len(cities)}): "
+                            f"{len(city_jobs)} jobs collected")
         
         # Process and save results
-        if all_jobs_data:
-            # Save raw data
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            DataProcessor.save_to_csv(all_jobs_data, f"jobs_data_{timestamp}.csv")
-            
+        if aggregator.total_jobs:
             # Generate analysis
-            analysis = DataProcessor.analyze_job_market(all_jobs_data)
-            ReportGenerator.generate_market_report(analysis)
+            ReportGenerator.generate_market_report(aggregator.summary())
             
-            logger.info(f"Scraping completed: {len(all_jobs_data)} total jobs collected")
-            logger.info("Data saved to 'data/' directory")
+            logger.info(f"Scraping completed: {aggregator.total_jobs} total jobs collected")
+            logger.info(f"Data saved to {csv_writer.filepath}")
         else:
+            Path(csv_writer.filepath).unlink()
             logger.warning("No job data collected")
     
     except Exception as e:
         logger.error(f"Scraping failed: {e}")
     
     finally:
-        scraper.close()
+        listener.stop()
         logger.info("Scraper shutdown complete")
 
 if __name__ == "__main__":
@@ -0,0 +1,22 @@
+"""
+Data models for Google Jobs Scraper
+Job records shared by the scraper and data processing utilities
+"""
+
+from dataclasses import dataclass, fields
+
+@dataclass(slots=True)
+class Job:
+    """A single scraped job listing"""
+    job_id: str
+    city: str
+    timestamp: str
+    title: str = ''
+    company: str = ''
+    location: str = ''
+    application_link: str = ''
+    description: str = ''
+    scraping_status: str = 'success'
+
+# Column order of job records in CSV output
+JOB_FIELDS = tuple(field.name for field in fields(Job))
\ No newline at end of file
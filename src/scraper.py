@@ -3,31 +3,163 @@ Google Jobs Scraper
 Professional web scraper for job market analysis
 """
 
-import time
-import pandas as pd 
+from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException, WebDriverException
 import logging
+import re
 from typing import List, Dict, Optional
+from .models import Job
 
 logger = logging.getLogger(__name__)
 
+# Headings and ellipses stripped from descriptions in a single pass
+_DESC_CLEAN_RE = re.compile(r'Description du poste|Job Description|\.\.\.')
+
+# Upper bound on in-browser extraction time per job (panel, expand and slack)
+_SCRIPT_SECONDS_PER_JOB = 15
+
+# Jobs extracted per async script call, and extra script timeout beyond the batch budget
+_EXTRACT_BATCH_SIZE = 10
+_SCRIPT_TIMEOUT_SLACK = 5
+
+# Static assets the scraper never reads; stylesheets stay since panel detection relies on layout
+_BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.mp4', '*.webm', '*.mp3'
+]
+
+# Injected once per results page with the scraper's apply link XPaths and expand button XPath;
+# extracts jobs entirely in the browser
+_JOB_EXTRACTOR_JS = """
+const [APPLY_LINK_XPATHS, EXPAND_XPATH] = arguments;
+
+// Shared with the Selenium fallback: first external link found, trying XPaths in priority order
+window.__findApplyLink = function (pane) {
+    for (const xpath of APPLY_LINK_XPATHS) {
+        const links = document.evaluate(xpath, pane, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (let i = 0; i < links.snapshotLength; i++) {
+            const href = links.snapshotItem(i).href;
+            if (href && href.includes('http') && !href.includes('google.com')) return href;
+        }
+    }
+    return null;
+};
+
+window.__extractJob = async function (index) {
+    const PANE = "div.BIB1wf[style*='display: block']";
+    const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+    const waitFor = async (check, timeout) => {
+        const deadline = Date.now() + timeout;
+        while (Date.now() < deadline) {
+            const result = check();
+            if (result) return result;
+            await sleep(100);
+        }
+        return check();
+    };
+    const isShown = (el) => el.isConnected && (el.getAttribute('style') || '').includes('display: block');
+    const descriptionText = (pane) => {
+        const desc = pane.querySelector('div.NgUYpe');
+        return desc ? desc.innerText.trim() : null;
+    };
+
+    const card = document.querySelectorAll('.PUpOsf')[index];
+    if (!card) throw new Error('Job card ' + index + ' not found');
+
+    const job = {has_pane: false};
+    const previous = document.querySelector(PANE);
+    card.click();
+    if (previous) await waitFor(() => !isShown(previous), 5000);
+
+    const pane = await waitFor(() => document.querySelector(PANE), 5000);
+    if (!pane) return job;
+    job.has_pane = true;
+
+    const info = pane.querySelector('div.waQ7qe');
+    job.company_location = info ? info.innerText.trim() : null;
+
+    job.application_link = window.__findApplyLink(pane);
+
+    const expandButton = document.evaluate(
+        EXPAND_XPATH, pane, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (expandButton) {
+        const length = (descriptionText(pane) || '').length;
+        expandButton.click();
+        await waitFor(() => !expandButton.isConnected || (descriptionText(pane) || '').length > length, 3000);
+    }
+
+    job.description = descriptionText(pane);
+    return job;
+};
+
+// Extracts up to count jobs from start, returning early rather than overrunning the time budget
+window.__extractAllJobs = async function (start, count, perJobMs) {
+    const deadline = Date.now() + count * perJobMs;
+    const jobs = [];
+    window.__extractRunning = true;
+    try {
+        for (let index = start; index < start + count; index++) {
+            if (window.__abortExtract || Date.now() + perJobMs > deadline) break;
+            try {
+                jobs.push(await window.__extractJob(index));
+            } catch (e) {
+                jobs.push({error: String(e)});
+            }
+        }
+    } finally {
+        window.__extractRunning = false;
+    }
+    return jobs;
+};
+
+window.__abortExtract = false;
+"""
+
 class GoogleJobsScraper:
     """Professional scraper for Google Jobs listings with market analysis capabilities"""
     
+    # Selector strategies, tried in order
+    _CONTAINER_SELECTORS = (
+        'div[jsname="iTtkOe"]',
+        'div[role="main"]',
+        'div.mQ25we',
+        'div#rcnt'
+    )
+    
+    _APPLY_LINK_SELECTORS = (
+        ".//a[contains(@title, 'Apply')]",
+        ".//a[contains(@title, 'Postuler')]",
+        ".//a[contains(@href, 'http') and contains(@class, 'LgbsSe')]",
+        ".//a[@target='_blank']"
+    )
+    
+    # Any matching expand button will do, so these are combined into one XPath union
+    _EXPAND_XPATH = " | ".join((
+        ".//div[@role='button' and .//*[contains(text(), 'Voir la description complète')]]",
+        ".//div[@role='button' and .//*[contains(text(), 'See full description')]]",
+        ".//div[contains(concat(' ', normalize-space(@class), ' '), ' nNzjpf-cS4Vcb-PvZLI-enNyge-KE6vqe-ma6Yeb ')]"
+    ))
+    
     def __init__(self, headless: bool = True, timeout: int = 30):
         self.headless = headless
         self.timeout = timeout
         self.driver = None
+        self._page_loaded = False
         self._setup_logging()
     
     def _setup_logging(self):
         """Setup professional logging"""
+        # Leave an already configured root logger alone; building the handlers below opens scraper.log
+        if logging.getLogger().handlers:
+            return
+        
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -54,19 +186,37 @@ class GoogleJobsScraper:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
+        # Return from navigation at DOMContentLoaded; explicit waits cover the rest
+        chrome_options.page_load_strategy = 'eager'
+        
         # Language and location preferences
         chrome_options.add_argument("--lang=en-US")
         chrome_options.add_argument("--accept-lang=en-US")
         
+        # Skip image downloads entirely
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2
+        })
+        
         try:
             service = Service()
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            self.driver.set_script_timeout(self.timeout)
+            self._block_unused_resources()
             logger.info("WebDriver initialized successfully")
             return True
         except Exception as e:
             logger.error(f"Failed to initialize WebDriver: {e}")
             return False
     
+    def _block_unused_resources(self):
+        """Block image, font and media requests through the DevTools protocol"""
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URL_PATTERNS})
+        except WebDriverException as e:
+            logger.warning(f"Could not block unused resources: {e}")
+    
     def scroll_to_load_all_jobs(self, max_scroll_attempts: int = 50) -> int:
         """
         Advanced scrolling mechanism to load all available jobs
@@ -74,10 +224,9 @@ class GoogleJobsScraper:
         """
         logger.info("Starting advanced job loading sequence")
         
-        current_job_count = 0
         scroll_attempts = 0
         no_new_jobs_count = 0
-        max_no_new_jobs = 3
+        max_no_new_jobs = 2
         
         # Wait for initial job elements
         try:
@@ -88,143 +237,126 @@ class GoogleJobsScraper:
             logger.warning("No job elements found initially")
             return 0
         
-        # Find scrollable container
+        current_job_count = self._count_jobs()
+        
+        # Find scrollable container, used if scroll gestures are unavailable
         container = self._find_scroll_container()
         
         while (scroll_attempts < max_scroll_attempts and 
                no_new_jobs_count < max_no_new_jobs):
             
-            job_elements = self.driver.find_elements(By.CSS_SELECTOR, ".PUpOsf")
-            new_count = len(job_elements)
+            self._scroll_container(container)
             
-            logger.debug(f"Scroll attempt {scroll_attempts + 1}: {new_count} jobs found")
-            
-            if new_count == current_job_count:
-                no_new_jobs_count += 1
-                logger.debug(f"No new jobs detected ({no_new_jobs_count}/{max_no_new_jobs})")
-            else:
+            # Wait for new content instead of a fixed delay
+            if self._detect_new_content(container, current_job_count):
+                new_count = self._count_jobs()
                 no_new_jobs_count = 0
                 logger.info(f"Loaded {new_count - current_job_count} new jobs")
-            
-            current_job_count = new_count
-            
-            # Multiple scrolling strategies
-            self._execute_scroll_strategies(container, job_elements)
-            
-            # Wait for content to load
-            time.sleep(2)
-            
-            # Check for new content
-            if not self._detect_new_content(container, current_job_count):
-                logger.debug("No new content detected after scroll")
+                current_job_count = new_count
+            else:
+                no_new_jobs_count += 1
+                logger.debug(f"No new jobs detected ({no_new_jobs_count}/{max_no_new_jobs})")
             
             scroll_attempts += 1
+            logger.debug(f"Scroll attempt {scroll_attempts}: {current_job_count} jobs found")
         
-        final_count = len(self.driver.find_elements(By.CSS_SELECTOR, ".PUpOsf"))
-        logger.info(f"Job loading complete: {final_count} total jobs found")
-        return final_count
+        logger.info(f"Job loading complete: {current_job_count} total jobs found")
+        return current_job_count
     
     def _find_scroll_container(self):
-        """Find the appropriate scroll container using multiple selectors"""
-        container_selectors = [
-            'div[jsname="iTtkOe"]',
-            'div[role="main"]',
-            'div.mQ25we',
-            'div#rcnt'
-        ]
-        
-        for selector in container_selectors:
-            try:
-                container = self.driver.find_element(By.CSS_SELECTOR, selector)
-                logger.debug(f"Using scroll container: {selector}")
-                return container
-            except NoSuchElementException:
-                continue
-        
-        # Fallback to body
-        return self.driver.find_element(By.TAG_NAME, 'body')
-    
-    def _execute_scroll_strategies(self, container, job_elements):
-        """Execute multiple scrolling strategies for reliability"""
-        strategies = [
-            self._scroll_to_bottom(container),
-            self._scroll_to_last_element(job_elements),
-            self._scroll_js_smooth(container)
-        ]
-        
-        for strategy in strategies:
-            try:
-                strategy()
-                break
-            except Exception as e:
-                logger.debug(f"Scroll strategy failed: {e}")
-                continue
-    
-    def _scroll_to_bottom(self, container):
-        """Scroll container to bottom"""
-        def execute():
+        """Find the scroll container in one round-trip, trying selectors in priority order"""
+        return self.driver.execute_script("""
+            for (const selector of arguments[0]) {
+                const container = document.querySelector(selector);
+                if (container) return container;
+            }
+            return document.body;
+        """, list(self._CONTAINER_SELECTORS))
+    
+    def _scroll_origin(self) -> Dict:
+        """Viewport point on the last job card, which always lies inside the scrolling list"""
+        return self.driver.execute_script("""
+            const cards = document.querySelectorAll('.PUpOsf');
+            const last = cards[cards.length - 1];
+            last.scrollIntoView({block: 'end'});
+            const rect = last.getBoundingClientRect();
+            const top = Math.max(rect.top, 0);
+            const bottom = Math.min(rect.bottom, window.innerHeight);
+            return {x: rect.left + rect.width / 2, y: top + (bottom - top) / 2};
+        """)
+    
+    def _scroll_container(self, container):
+        """Scroll the results list with one large CDP gesture, falling back to scrollTop"""
+        try:
+            origin = self._scroll_origin()
+            self.driver.execute_cdp_cmd('Input.synthesizeScrollGesture', {
+                'x': origin['x'],
+                'y': origin['y'],
+                'yDistance': -50000,
+                'speed': 50000,
+                'gestureSourceType': 'mouse'
+            })
+        except WebDriverException as e:
+            logger.debug(f"Scroll gesture failed, using scrollTop: {e}")
             self.driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", container)
-        return execute
-    
-    def _scroll_to_last_element(self, job_elements):
-        """Scroll to last job element"""
-        def execute():
-            if job_elements:
-                last_job = job_elements[-1]
-                self.driver.execute_script(
-                    "arguments[0].scrollIntoView({behavior: 'smooth', block: 'end'});", 
-                    last_job
-                )
-        return execute
-    
-    def _scroll_js_smooth(self, container):
-        """Smooth JavaScript scroll"""
-        def execute():
-            self.driver.execute_script("""
-                arguments[0].scrollTo({
-                    top: arguments[0].scrollHeight,
-                    behavior: 'smooth'
-                });
-            """, container)
-        return execute
+    
+    def _count_jobs(self) -> int:
+        """Count loaded job cards in the browser without transferring element handles"""
+        return int(self.driver.execute_script("return document.querySelectorAll('.PUpOsf').length;"))
     
     def _detect_new_content(self, container, current_count: int) -> bool:
         """Detect if new content has loaded after scrolling"""
         try:
-            WebDriverWait(self.driver, 5).until(
-                lambda d: len(d.find_elements(By.CSS_SELECTOR, ".PUpOsf")) > current_count
+            WebDriverWait(self.driver, 5, poll_frequency=0.1).until(
+                lambda d: d.execute_script(
+                    "return document.readyState === 'complete'"
+                    " && document.querySelectorAll('.PUpOsf').length > arguments[0];",
+                    current_count
+                )
             )
             return True
         except TimeoutException:
             return False
     
-    def extract_job_data(self, job_element, index: int, city: str) -> Dict:
+    def _read_job_titles(self) -> List[str]:
+        """Read every loaded job card's rendered text in a single round-trip"""
+        return self.driver.execute_script(
+            "return Array.from(document.querySelectorAll('.PUpOsf'), (card) => card.innerText.trim());"
+        ) or []
+    
+    def extract_job_data(self, index: int, city: str, title: Optional[str] = None,
+                         extracted: Optional[Dict] = None) -> Job:
         """
         Extract comprehensive job data from listing
         Includes error handling and data validation
         """
-        job_data = {
-            'job_id': f"{city.lower()}_{index + 1}",
-            'city': city,
-            'timestamp': pd.Timestamp.now().isoformat(),
-            'title': '',
-            'company': '',
-            'location': '',
-            'application_link': '',
-            'description': '',
-            'scraping_status': 'success'
-        }
+        timestamp = datetime.now().isoformat()
+        
+        # Only the fields found so far; Job supplies defaults for the rest
+        job_data = {}
         
         try:
-            # Extract basic job information
-            job_data.update(self._extract_basic_info(job_element))
+            # Card text comes from the bulk title read when available
+            if title is None:
+                job_data.update(self._extract_basic_info(index))
+            else:
+                job_data['title'] = title
+            
+            # Use the city-wide extraction result if given, else one round-trip for this job
+            if extracted is None:
+                try:
+                    extracted = self._run_extractor(index)
+                except WebDriverException as e:
+                    logger.debug(f"Extractor script call failed for job {index + 1}: {e}")
+            
+            details = self._parse_extracted(extracted) if extracted is not None else None
             
-            # Click and get detailed information
-            self.driver.execute_script("arguments[0].click();", job_element)
-            time.sleep(1)
+            # Fall back to per-element Selenium calls when the extractor produced nothing usable
+            if details is None:
+                logger.debug(f"In-browser extraction failed for job {index + 1}, using Selenium")
+                details = self._extract_with_selenium(index)
             
-            # Extract detailed information from job panel
-            job_data.update(self._extract_detailed_info())
+            job_data.update(details)
             
             logger.debug(f"Successfully extracted job {index + 1} in {city}")
             
@@ -232,18 +364,122 @@ class GoogleJobsScraper:
             logger.warning(f"Failed to extract job {index + 1} in {city}: {e}")
             job_data['scraping_status'] = f'error: {str(e)[:100]}'
         
-        return job_data
+        return Job(job_id=f"{city.lower()}_{index + 1}", city=city, timestamp=timestamp, **job_data)
     
-    def _extract_basic_info(self, job_element) -> Dict:
+    def _inject_extractor(self):
+        """Install the in-browser job extractor on the current page"""
+        self.driver.execute_script(_JOB_EXTRACTOR_JS, list(self._APPLY_LINK_SELECTORS), self._EXPAND_XPATH)
+    
+    def _extract_all_in_browser(self, count: int) -> List[Dict]:
+        """Click through and extract loaded jobs in the browser, one async script call per batch"""
+        self.driver.set_script_timeout(_EXTRACT_BATCH_SIZE * _SCRIPT_SECONDS_PER_JOB + _SCRIPT_TIMEOUT_SLACK)
+        extracted = []
+        
+        try:
+            while len(extracted) < count:
+                batch = self.driver.execute_async_script(
+                    "const done = arguments[arguments.length - 1];"
+                    "window.__extractAllJobs(arguments[0], arguments[1], arguments[2]).then(done, (e) => done([]));",
+                    len(extracted),
+                    min(_EXTRACT_BATCH_SIZE, count - len(extracted)),
+                    _SCRIPT_SECONDS_PER_JOB * 1000
+                )
+                
+                if not batch:
+                    break
+                
+                extracted.extend(batch)
+                logger.info(f"In-browser extraction: {len(extracted)}/{count} jobs")
+                
+        except WebDriverException as e:
+            logger.warning(f"Bulk in-browser extraction failed, extracting remaining jobs one by one: {e}")
+            self._abort_bulk_extraction()
+        finally:
+            self.driver.set_script_timeout(self.timeout)
+        
+        return extracted
+    
+    def _abort_bulk_extraction(self):
+        """Stop a still-running bulk extraction so it cannot interleave clicks with the fallback"""
+        try:
+            self.driver.execute_script("window.__abortExtract = true;")
+            WebDriverWait(self.driver, _SCRIPT_SECONDS_PER_JOB, poll_frequency=0.1).until(
+                lambda d: not d.execute_script("return window.__extractRunning === true;")
+            )
+        except WebDriverException as e:
+            logger.debug(f"Could not confirm bulk extraction stopped: {e}")
+    
+    def _run_extractor(self, index: int) -> Dict:
+        """Click and extract a single job with one async script call"""
+        return self.driver.execute_async_script(
+            "const done = arguments[arguments.length - 1];"
+            "window.__extractJob(arguments[0]).then(done, (e) => done({error: String(e)}));",
+            index
+        )
+    
+    def _parse_extracted(self, raw: Dict) -> Optional[Dict]:
+        """Turn the in-browser extractor's raw fields into job data, or None if it reported an error"""
+        if not raw or raw.get('error'):
+            logger.debug(f"Extractor reported: {raw.get('error') if raw else 'no data'}")
+            return None
+        
+        if not raw.get('has_pane'):
+            logger.debug("Could not extract detailed info: details panel not shown")
+            return {}
+        
+        info = self._parse_company_location(raw.get('company_location'))
+        info['application_link'] = raw.get('application_link') or 'Not found'
+        
+        if raw.get('description') is None:
+            info['description'] = "Description not available"
+        else:
+            info['description'] = self._clean_description(raw['description'])
+        
+        return info
+    
+    def _extract_with_selenium(self, index: int) -> Dict:
+        """Extract a job's details through individual WebDriver commands"""
+        # Click and wait for the previous job's panel to be replaced
+        previous_pane = self._find_active_pane()
+        self.driver.execute_script("document.querySelectorAll('.PUpOsf')[arguments[0]].click();", index)
+        self._wait_for_pane_change(previous_pane)
+        
+        # Extract detailed information from job panel
+        return self._extract_detailed_info()
+    
+    def _extract_basic_info(self, index: int) -> Dict:
         """Extract basic job information from list element"""
         info = {}
         try:
-            info['title'] = job_element.text.strip()
+            info['title'] = self.driver.execute_script(
+                "return document.querySelectorAll('.PUpOsf')[arguments[0]].innerText;", index
+            ).strip()
         except Exception:
             info['title'] = 'Unknown'
         
         return info
     
+    def _find_active_pane(self):
+        """Return the currently displayed job details panel, if any"""
+        panes = self.driver.find_elements(By.CSS_SELECTOR, "div.BIB1wf[style*='display: block']")
+        return panes[0] if panes else None
+    
+    def _wait_for_pane_change(self, previous_pane):
+        """Wait until the previously displayed details panel is detached or hidden"""
+        if previous_pane is None:
+            return
+        
+        def pane_replaced(driver):
+            try:
+                return 'display: block' not in (previous_pane.get_attribute('style') or '')
+            except StaleElementReferenceException:
+                return True
+        
+        try:
+            WebDriverWait(self.driver, 5, poll_frequency=0.1).until(pane_replaced)
+        except TimeoutException:
+            logger.debug("Details panel did not change after click")
+    
     def _extract_detailed_info(self) -> Dict:
         """Extract detailed information from job details panel"""
         info = {}
@@ -272,40 +508,35 @@ class GoogleJobsScraper:
         """Extract company and location information"""
         try:
             info_element = active_pane.find_element(By.CSS_SELECTOR, "div.waQ7qe")
-            text = info_element.text.strip().replace('\n', ' | ')
-            
-            # Basic parsing (can be enhanced with NLP)
-            parts = text.split('•')
-            company = parts[0].strip() if len(parts) > 0 else 'Unknown'
-            location = parts[1].strip() if len(parts) > 1 else 'Unknown'
-            
-            return {
-                'company': company,
-                'location': location
-            }
+            return self._parse_company_location(info_element.text)
         except Exception:
             return {'company': 'Unknown', 'location': 'Unknown'}
     
+    def _parse_company_location(self, text: Optional[str]) -> Dict:
+        """Split the panel's company/location line into its parts"""
+        if text is None:
+            return {'company': 'Unknown', 'location': 'Unknown'}
+        
+        text = text.strip().replace('\n', ' | ')
+        
+        # Basic parsing (can be enhanced with NLP)
+        parts = text.split('•')
+        company = parts[0].strip() if len(parts) > 0 else 'Unknown'
+        location = parts[1].strip() if len(parts) > 1 else 'Unknown'
+        
+        return {
+            'company': company,
+            'location': location
+        }
+    
     def _extract_application_link(self, active_pane) -> str:
-        """Extract application link using multiple strategies"""
-        link_selectors = [
-            ".//a[contains(@title, 'Apply')]",
-            ".//a[contains(@title, 'Postuler')]",
-            ".//a[contains(@href, 'http') and contains(@class, 'LgbsSe')]",
-            ".//a[target='_blank']"
-        ]
-        
-        for selector in link_selectors:
-            try:
-                links = active_pane.find_elements(By.XPATH, selector)
-                for link in links:
-                    href = link.get_attribute('href')
-                    if href and 'http' in href and 'google.com' not in href:
-                        return href
-            except Exception:
-                continue
+        """Extract application link in one round-trip via the injected extractor's link finder"""
+        try:
+            href = self.driver.execute_script("return window.__findApplyLink(arguments[0]);", active_pane)
+        except Exception:
+            href = None
         
-        return 'Not found'
+        return href or 'Not found'
     
     def _extract_description(self, active_pane) -> str:
         """Extract and expand job description"""
@@ -315,41 +546,50 @@ class GoogleJobsScraper:
             
             # Extract description text
             desc_container = active_pane.find_element(By.CSS_SELECTOR, "div.NgUYpe")
-            description = desc_container.text.strip()
-            
-            # Clean description
-            description = description.replace("Description du poste", "")\
-                                    .replace("Job Description", "")\
-                                    .replace("...", "").strip()
-            
-            return " ".join(description.split())
+            return self._clean_description(desc_container.text)
             
         except Exception:
             return "Description not available"
     
+    def _clean_description(self, description: str) -> str:
+        """Strip headings and ellipses and collapse whitespace"""
+        description = _DESC_CLEAN_RE.sub('', description.strip()).strip()
+        
+        return " ".join(description.split())
+    
     def _expand_description(self, active_pane):
         """Expand job description if truncated"""
-        expand_selectors = [
-            ".//div[@role='button' and .//*[contains(text(), 'Voir la description complète')]]",
-            ".//div[@role='button' and .//*[contains(text(), 'See full description')]]",
-            "div.nNzjpf-cS4Vcb-PvZLI-enNyge-KE6vqe-ma6Yeb"
-        ]
-        
-        for selector in expand_selectors:
+        try:
+            expand_btn = active_pane.find_element(By.XPATH, self._EXPAND_XPATH)
+            desc_length = self._description_length(active_pane)
+            self.driver.execute_script("arguments[0].click();", expand_btn)
+            self._wait_for_expansion(active_pane, expand_btn, desc_length)
+            logger.debug("Expanded job description")
+        except Exception:
+            pass
+    
+    def _description_length(self, active_pane) -> int:
+        """Current length of the description text in the details panel"""
+        try:
+            return len(active_pane.find_element(By.CSS_SELECTOR, "div.NgUYpe").text)
+        except (NoSuchElementException, StaleElementReferenceException):
+            return 0
+    
+    def _wait_for_expansion(self, active_pane, expand_btn, previous_length: int):
+        """Wait until the expand button goes stale or the description grows"""
+        def expanded(driver):
             try:
-                if 'XPath' in selector:
-                    expand_btn = active_pane.find_element(By.XPATH, selector)
-                else:
-                    expand_btn = active_pane.find_element(By.CSS_SELECTOR, selector)
-                
-                self.driver.execute_script("arguments[0].click();", expand_btn)
-                time.sleep(1)
-                logger.debug("Expanded job description")
-                break
-            except Exception:
-                continue
-    
-    def scrape_city(self, city: str, country_code: str = "ma", language: str = "fr") -> List[Dict]:
+                expand_btn.is_displayed()
+            except StaleElementReferenceException:
+                return True
+            return self._description_length(active_pane) > previous_length
+        
+        try:
+            WebDriverWait(self.driver, 3, poll_frequency=0.1).until(expanded)
+        except TimeoutException:
+            logger.debug("Description did not expand after click")
+    
+    def scrape_city(self, city: str, country_code: str = "ma", language: str = "fr") -> List[Job]:
         """
         Scrape all jobs for a specific city
         Returns comprehensive job data for market analysis
@@ -361,7 +601,7 @@ class GoogleJobsScraper:
         try:
             # Generate and navigate to direct jobs URL
             url = self._generate_jobs_url(city, country_code, language)
-            self.driver.get(url)
+            self._navigate(url)
             
             # Load all available jobs
             total_jobs = self.scroll_to_load_all_jobs()
@@ -372,12 +612,18 @@ class GoogleJobsScraper:
             
             logger.info(f"Scraping {total_jobs} jobs in {city}")
             
-            # Extract data for each job
-            job_elements = self.driver.find_elements(By.CSS_SELECTOR, ".PUpOsf")
+            # Card text for all jobs in one pass
+            titles = self._read_job_titles()
+            
+            # Details for all jobs in batched script calls; missing entries are retried per job
+            self._inject_extractor()
+            extracted = self._extract_all_in_browser(total_jobs)
             
-            for i in range(min(total_jobs, len(job_elements))):
+            for i in range(total_jobs):
                 try:
-                    job_data = self.extract_job_data(job_elements[i], i, city)
+                    title = titles[i] if i < len(titles) else None
+                    raw = extracted[i] if i < len(extracted) else None
+                    job_data = self.extract_job_data(i, city, title, raw)
                     jobs_data.append(job_data)
                     
                     # Progress logging
@@ -395,6 +641,17 @@ class GoogleJobsScraper:
         
         return jobs_data
     
+    def _navigate(self, url: str):
+        """Open a results page, navigating in-page after the first load to keep connections warm"""
+        if not self._page_loaded:
+            self.driver.get(url)
+            self._page_loaded = True
+            return
+        
+        previous_document = self.driver.find_element(By.TAG_NAME, 'html')
+        self.driver.execute_script("window.location.href = arguments[0];", url)
+        WebDriverWait(self.driver, self.timeout).until(EC.staleness_of(previous_document))
+    
     def _generate_jobs_url(self, city: str, country_code: str, language: str) -> str:
         """Generate direct Google Jobs URL for location"""
         city_encoded = city.lower().replace(' ', '+')
@@ -3,64 +3,144 @@ Utility functions for Google Jobs Scraper
 Data processing and analysis utilities
 """
 
-import pandas as pd
+import csv
 import json
 import logging
-from typing import List, Dict, Any
+import os
+from collections import Counter
+from dataclasses import asdict
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Sequence
 from pathlib import Path
+from .models import Job, JOB_FIELDS
 
 logger = logging.getLogger(__name__)
 
+REPORT_TEMPLATE = """# Job Market Analysis Report
+Generated on: {generated_on}
+
+## Executive Summary
+- **Total Jobs Analyzed**: {total_jobs:,}
+- **Cities Covered**: {cities_covered}
+- **Companies Represented**: {companies_represented}
+- **Data Quality Score**: {success_rate:.1f}%
+
+## Detailed Analysis
+### Geographic Distribution{city_lines}
+
+### Top Employers{company_lines}
+
+### Data Quality Metrics{quality_lines}"""
+
+@lru_cache(maxsize=4)
+def _load_json(path: str, mtime: float) -> Any:
+    """Parse a JSON file, cached per path and modification time"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+class JobCsvWriter:
+    """Append job rows to a CSV file as they are collected"""
+    
+    def __init__(self, filename: str, fieldnames: Sequence[str]):
+        # Ensure data directory exists
+        Path('data').mkdir(exist_ok=True)
+        
+        self.filepath = f"data/{filename}"
+        self._file = open(self.filepath, 'w', encoding='utf-8', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=list(fieldnames))
+        self._writer.writeheader()
+    
+    def write_rows(self, jobs_data: List[Job]):
+        """Write rows and flush so completed work survives a crash"""
+        self._writer.writerows(asdict(job) for job in jobs_data)
+        self._file.flush()
+    
+    def close(self):
+        """Close the underlying file"""
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+class MarketAggregator:
+    """Running market statistics, updated batch by batch"""
+    
+    def __init__(self):
+        self.total_jobs = 0
+        self.company_counts = Counter()
+        self.city_counts = Counter()
+        self.successes = 0
+        self.has_title = 0
+        self.has_company = 0
+        self.has_location = 0
+        self.has_description = 0
+    
+    def update(self, jobs_data: Iterable[Job]):
+        """Fold a batch of job records into the running totals"""
+        for job in jobs_data:
+            self.total_jobs += 1
+            self.company_counts[job.company] += 1
+            self.city_counts[job.city] += 1
+            self.successes += job.scraping_status == 'success'
+            self.has_title += job.title is not None
+            self.has_company += job.company is not None
+            self.has_location += job.location is not None
+            self.has_description += job.description != ''
+    
+    def summary(self) -> Dict[str, Any]:
+        """Market analysis for everything seen so far"""
+        total = self.total_jobs
+        if not total:
+            return {}
+        
+        return {
+            'total_jobs': total,
+            'cities_covered': len(self.city_counts),
+            'companies_represented': len(self.company_counts),
+            'success_rate': self.successes / total * 100,
+            'top_companies': dict(self.company_counts.most_common(10)),
+            'city_distribution': dict(self.city_counts.most_common()),
+            'data_quality': {
+                'has_title': self.has_title / total * 100,
+                'has_company': self.has_company / total * 100,
+                'has_location': self.has_location / total * 100,
+                'has_description': self.has_description / total * 100,
+            }
+        }
+
 class DataProcessor:
     """Process and analyze scraped job data"""
     
     @staticmethod
-    def save_to_csv(jobs_data: List[Dict], filename: str):
+    def save_to_csv(jobs_data: List[Job], filename: str):
         """Save job data to CSV with proper formatting"""
         if not jobs_data:
             logger.warning("No data to save")
             return
         
-        df = pd.DataFrame(jobs_data)
-        
-        # Ensure data directory exists
-        Path('data').mkdir(exist_ok=True)
+        with JobCsvWriter(filename, JOB_FIELDS) as writer:
+            writer.write_rows(jobs_data)
         
-        filepath = f"data/{filename}"
-        df.to_csv(filepath, index=False, encoding='utf-8')
-        logger.info(f"Data saved to {filepath}")
+        logger.info(f"Data saved to {writer.filepath}")
     
     @staticmethod
-    def analyze_job_market(jobs_data: List[Dict]) -> Dict[str, Any]:
+    def analyze_job_market(jobs_data: List[Job]) -> Dict[str, Any]:
         """Generate market analysis from job data"""
-        if not jobs_data:
-            return {}
-        
-        df = pd.DataFrame(jobs_data)
-        
-        analysis = {
-            'total_jobs': len(df),
-            'cities_covered': df['city'].nunique(),
-            'companies_represented': df['company'].nunique(),
-            'success_rate': (df['scraping_status'] == 'success').mean() * 100,
-            'top_companies': df['company'].value_counts().head(10).to_dict(),
-            'city_distribution': df['city'].value_counts().to_dict(),
-            'data_quality': {
-                'has_title': df['title'].notna().mean() * 100,
-                'has_company': df['company'].notna().mean() * 100,
-                'has_location': df['location'].notna().mean() * 100,
-                'has_description': (df['description'] != '').mean() * 100,
-            }
-        }
-        
-        return analysis
+        aggregator = MarketAggregator()
+        aggregator.update(jobs_data)
+        return aggregator.summary()
     
     @staticmethod
     def load_city_config(config_file: str = "config/cities.json") -> List[Dict]:
         """Load city configuration from JSON file"""
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            # Reparsed only when the file changes; copies keep the cached entries intact
+            cities = _load_json(config_file, os.path.getmtime(config_file))
+            return [dict(city) for city in cities]
         except FileNotFoundError:
             logger.warning(f"Config file {config_file} not found, using default cities")
             return [
@@ -75,45 +155,33 @@ class ReportGenerator:
     @staticmethod
     def generate_market_report(analysis: Dict, output_file: str = "market_analysis.md"):
         """Generate a professional market analysis report"""
-        report = [
-            "# Job Market Analysis Report",
-            f"Generated on: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-            "## Executive Summary",
-            f"- **Total Jobs Analyzed**: {analysis.get('total_jobs', 0):,}",
-            f"- **Cities Covered**: {analysis.get('cities_covered', 0)}",
-            f"- **Companies Represented**: {analysis.get('companies_represented', 0)}",
-            f"- **Data Quality Score**: {analysis.get('success_rate', 0):.1f}%",
-            "",
-            "## Detailed Analysis",
-            "### Geographic Distribution",
-        ]
+        # Each list line carries its own leading newline so empty sections stay compact
+        city_lines = "".join(
+            f"\n- {city}: {count:,} jobs"
+            for city, count in analysis.get('city_distribution', {}).items()
+        )
+        company_lines = "".join(
+            f"\n- {company}: {count:,} listings"
+            for company, count in analysis.get('top_companies', {}).items()
+        )
+        quality_lines = "".join(
+            f"\n- {metric.replace('_', ' ').title()}: {score:.1f}%"
+            for metric, score in analysis.get('data_quality', {}).items()
+        )
         
-        # Add city distribution
-        for city, count in analysis.get('city_distribution', {}).items():
-            report.append(f"- {city}: {count:,} jobs")
-        
-        report.extend([
-            "",
-            "### Top Employers",
-        ])
-        
-        # Add top companies
-        for company, count in analysis.get('top_companies', {}).items():
-            report.append(f"- {company}: {count:,} listings")
-        
-        report.extend([
-            "",
-            "### Data Quality Metrics",
-        ])
-        
-        # Add data quality metrics
-        quality = analysis.get('data_quality', {})
-        for metric, score in quality.items():
-            report.append(f"- {metric.replace('_', ' ').title()}: {score:.1f}%")
+        report = REPORT_TEMPLATE.format(
+            generated_on=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            total_jobs=analysis.get('total_jobs', 0),
+            cities_covered=analysis.get('cities_covered', 0),
+            companies_represented=analysis.get('companies_represented', 0),
+            success_rate=analysis.get('success_rate', 0),
+            city_lines=city_lines,
+            company_lines=company_lines,
+            quality_lines=quality_lines
+        )
         
         # Save report
-        with open(f"data/{output_file}", 'w', encoding='utf-8') as f:
-            f.write('\n'.join(report))
+        Path('data').mkdir(exist_ok=True)
+        Path(f"data/{output_file}").write_text(report, encoding='utf-8')
         
         logger.info(f"Market report saved to data/{output_file}")
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""
+Tests for data processing utilities
+"""
+
+import csv
+import os
+import tempfile
+import unittest
+
+from src.models import Job, JOB_FIELDS
+from src.utils import JobCsvWriter, MarketAggregator
+
+def make_job(index, city='Rabat', company='Acme', **overrides):
+    return Job(job_id=f"{city.lower()}_{index}", city=city, timestamp='2026-01-01T00:00:00',
+               company=company, **overrides)
+
+class TestMarketAggregator(unittest.TestCase):
+
+    def test_empty_summary(self):
+        self.assertEqual(MarketAggregator().summary(), {})
+
+    def test_summary_across_batches(self):
+        aggregator = MarketAggregator()
+        aggregator.update([
+            make_job(1, company='Acme', description='Python developer'),
+            make_job(2, company='Acme'),
+        ])
+        aggregator.update([
+            make_job(1, city='Casablanca', company='Globex', scraping_status='error: timeout'),
+            make_job(2, city='Casablanca', company='Acme', description='Data analyst'),
+        ])
+
+        summary = aggregator.summary()
+
+        self.assertEqual(summary['total_jobs'], 4)
+        self.assertEqual(summary['cities_covered'], 2)
+        self.assertEqual(summary['companies_represented'], 2)
+        self.assertEqual(summary['success_rate'], 75.0)
+        self.assertEqual(summary['top_companies'], {'Acme': 3, 'Globex': 1})
+        self.assertEqual(list(summary['top_companies']), ['Acme', 'Globex'])
+        self.assertEqual(summary['city_distribution'], {'Rabat': 2, 'Casablanca': 2})
+        self.assertEqual(summary['data_quality']['has_description'], 50.0)
+        self.assertEqual(summary['data_quality']['has_title'], 100.0)
+
+    def test_top_companies_limited_to_ten(self):
+        aggregator = MarketAggregator()
+        aggregator.update(make_job(i, company=f"Company {i}") for i in range(15))
+
+        self.assertEqual(len(aggregator.summary()['top_companies']), 10)
+        self.assertEqual(aggregator.summary()['companies_represented'], 15)
+
+class TestJobCsvWriter(unittest.TestCase):
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def read_rows(self, filepath):
+        with open(filepath, encoding='utf-8', newline='') as f:
+            return list(csv.reader(f))
+
+    def test_header_and_column_order(self):
+        with JobCsvWriter('jobs.csv', JOB_FIELDS) as writer:
+            writer.write_rows([make_job(1, title='Engineer', description='Builds, tests')])
+
+        rows = self.read_rows(writer.filepath)
+
+        self.assertEqual(writer.filepath, 'data/jobs.csv')
+        self.assertEqual(rows[0], list(JOB_FIELDS))
+        self.assertEqual(rows[1], ['rabat_1', 'Rabat', '2026-01-01T00:00:00', 'Engineer', 'Acme',
+                                   '', '', 'Builds, tests', 'success'])
+
+    def test_rows_flushed_per_batch(self):
+        with JobCsvWriter('jobs.csv', JOB_FIELDS) as writer:
+            writer.write_rows([make_job(1), make_job(2)])
+            self.assertEqual(len(self.read_rows(writer.filepath)), 3)
+
+            writer.write_rows([make_job(3)])
+            self.assertEqual(len(self.read_rows(writer.filepath)), 4)
+
+if __name__ == '__main__':
+    unittest.main()